@@ -4,10 +4,61 @@ Analyze the actual structure of the Ashby script to understand how jobs are stor
 """
 
 import asyncio
+import codecs
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
 import json
+import orjson
 import re
+from itertools import islice
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Patterns used to probe the script, compiled once at import
+_JOBS_RE = re.compile(r'jobs')
+_TITLE_RES = [
+    re.compile(r'"title"\s*:\s*"([^"]+)"'),
+    re.compile(r'title:\s*"([^"]+)"'),
+    re.compile(r'title:\s*\'([^\']+)\''),
+]
+_ID_RES = [
+    re.compile(r'"id"\s*:\s*"([^"]+)"'),
+    re.compile(r'id:\s*"([^"]+)"'),
+    re.compile(r'id:\s*\'([^\']+)\''),
+]
+_JOB_OBJECT_RE = re.compile(r'\{[^{}]*"id"[^{}]*"title"[^{}]*\}', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*}')
+# Every byte outside printable ASCII; deleting these from UTF-8 also drops
+# whole multi-byte characters, since all their bytes are >= 0x80
+_NON_PRINTABLE_BYTES = bytes(range(0x20)) + bytes(range(0x7F, 0x100))
+
+MAIN_SCRIPT_MIN_LENGTH = 100000
+CHUNK_SIZE = 65536
+
+async def find_main_script(response):
+    """Stream the page into lxml and return the first script over MAIN_SCRIPT_MIN_LENGTH chars."""
+    parser = etree.HTMLPullParser(events=('end',), tag='script')
+    # Feed decoded text so the HTTP charset is honoured; given bytes, lxml
+    # would guess the encoding and garble UTF-8 pages without a <meta charset>
+    decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+    
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        parser.feed(decoder.decode(chunk))
+        for _, element in parser.read_events():
+            text = element.text
+            if text and len(text) > MAIN_SCRIPT_MIN_LENGTH:
+                return text
+            element.clear()
+    
+    # Flush a script left open by a truncated page
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    for _, element in parser.read_events():
+        text = element.text
+        if text and len(text) > MAIN_SCRIPT_MIN_LENGTH:
+            return text
+    
+    return None
 
 async def analyze_script_structure():
     """Analyze the script structure to understand job data format."""
@@ -24,17 +75,8 @@ async def analyze_script_structure():
         try:
             async with session.get(url, headers=headers, timeout=15) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Find the main script
-                    scripts = soup.find_all('script')
-                    main_script = None
-                    
-                    for script in scripts:
-                        if script.string and len(script.string) > 100000:
-                            main_script = script.string
-                            break
+                    # Find the main script, stopping the download once it is parsed
+                    main_script = await find_main_script(response)
                     
                     if not main_script:
                         print("❌ No large script found")
@@ -46,12 +88,13 @@ async def analyze_script_structure():
                     print("\n🔍 Analyzing script content...")
                     
                     # Pattern 1: Look for "jobs" keyword
-                    jobs_positions = [m.start() for m in re.finditer(r'jobs', main_script)]
-                    print(f"Found 'jobs' keyword {len(jobs_positions)} times")
+                    jobs_count = main_script.count('jobs')
+                    print(f"Found 'jobs' keyword {jobs_count} times")
                     
-                    if jobs_positions:
+                    if jobs_count:
                         # Look at the context around the first few "jobs" occurrences
-                        for i, pos in enumerate(jobs_positions[:5]):
+                        first_matches = islice(_JOBS_RE.finditer(main_script), 5)
+                        for i, pos in enumerate(m.start() for m in first_matches):
                             context_start = max(0, pos - 100)
                             context_end = min(len(main_script), pos + 200)
                             context = main_script[context_start:context_end]
@@ -62,29 +105,17 @@ async def analyze_script_structure():
                     print("\n🔍 Looking for job-related patterns...")
                     
                     # Look for job title patterns
-                    title_patterns = [
-                        r'"title"\s*:\s*"([^"]+)"',
-                        r'title:\s*"([^"]+)"',
-                        r'title:\s*\'([^\']+)\''
-                    ]
-                    
-                    for pattern in title_patterns:
-                        matches = re.findall(pattern, main_script)
+                    for pattern in _TITLE_RES:
+                        matches = pattern.findall(main_script)
                         if matches:
-                            print(f"Found {len(matches)} title matches with pattern: {pattern}")
+                            print(f"Found {len(matches)} title matches with pattern: {pattern.pattern}")
                             print(f"Sample titles: {matches[:5]}")
                     
                     # Pattern 3: Look for job ID patterns
-                    id_patterns = [
-                        r'"id"\s*:\s*"([^"]+)"',
-                        r'id:\s*"([^"]+)"',
-                        r'id:\s*\'([^\']+)\''
-                    ]
-                    
-                    for pattern in id_patterns:
-                        matches = re.findall(pattern, main_script)
+                    for pattern in _ID_RES:
+                        matches = pattern.findall(main_script)
                         if matches:
-                            print(f"Found {len(matches)} ID matches with pattern: {pattern}")
+                            print(f"Found {len(matches)} ID matches with pattern: {pattern.pattern}")
                             print(f"Sample IDs: {matches[:5]}")
                     
                     # Pattern 4: Look for the actual job data structure
@@ -102,58 +133,41 @@ async def analyze_script_structure():
                         print(f"Context around 'jobs':")
                         print(f"  ...{context}...")
                         
-                        # Try to find the complete jobs array
-                        # Look for the opening bracket after "jobs"
+                        # Decode the jobs array in place: raw_decode parses exactly one
+                        # JSON value starting at the bracket and ignores the trailing JS
                         bracket_start = main_script.find('[', jobs_array_start)
                         if bracket_start != -1:
                             print(f"Found opening bracket at position {bracket_start}")
                             
-                            # Try to find the closing bracket
-                            bracket_count = 0
-                            bracket_end = bracket_start
-                            
-                            for i in range(bracket_start, len(main_script)):
-                                if main_script[i] == '[':
-                                    bracket_count += 1
-                                elif main_script[i] == ']':
-                                    bracket_count -= 1
-                                    if bracket_count == 0:
-                                        bracket_end = i + 1
-                                        break
-                            
-                            if bracket_end > bracket_start:
-                                jobs_array = main_script[bracket_start:bracket_end]
-                                print(f"Extracted jobs array ({len(jobs_array)} characters)")
+                            try:
+                                jobs_data, bracket_end = _JSON_DECODER.raw_decode(main_script, bracket_start)
+                                print(f"Extracted jobs array ({bracket_end - bracket_start} characters)")
                                 
-                                # Try to parse as JSON
-                                try:
-                                    jobs_data = json.loads(jobs_array)
-                                    if isinstance(jobs_data, list):
-                                        print(f"✅ Successfully parsed jobs array with {len(jobs_data)} jobs!")
-                                        
-                                        # Show first job structure
-                                        if jobs_data:
-                                            first_job = jobs_data[0]
-                                            print(f"\nFirst job structure:")
-                                            for key, value in first_job.items():
-                                                if isinstance(value, str) and len(value) > 100:
-                                                    print(f"  {key}: {value[:100]}...")
-                                                else:
-                                                    print(f"  {key}: {value}")
-                                            
-                                            return jobs_data
+                                if isinstance(jobs_data, list):
+                                    print(f"✅ Successfully parsed jobs array with {len(jobs_data)} jobs!")
                                     
-                                except json.JSONDecodeError as e:
-                                    print(f"❌ Failed to parse jobs array as JSON: {e}")
-                                    print("Array content preview:")
-                                    print(jobs_array[:500])
+                                    # Show first job structure
+                                    if jobs_data:
+                                        first_job = jobs_data[0]
+                                        print(f"\nFirst job structure:")
+                                        for key, value in first_job.items():
+                                            if isinstance(value, str) and len(value) > 100:
+                                                print(f"  {key}: {value[:100]}...")
+                                            else:
+                                                print(f"  {key}: {value}")
+                                        
+                                        return jobs_data
+                                
+                            except ValueError as e:
+                                print(f"❌ Failed to parse jobs array as JSON: {e}")
+                                print("Array content preview:")
+                                print(main_script[bracket_start:bracket_start + 500])
                     
                     # If we didn't find the jobs array, look for individual job objects
                     print("\n🔍 Looking for individual job objects...")
                     
                     # Look for objects that contain both id and title
-                    job_object_pattern = r'\{[^{}]*"id"[^{}]*"title"[^{}]*\}'
-                    job_objects = re.findall(job_object_pattern, main_script, re.DOTALL)
+                    job_objects = _JOB_OBJECT_RE.findall(main_script)
                     
                     if job_objects:
                         print(f"Found {len(job_objects)} potential job objects")
@@ -165,10 +179,10 @@ async def analyze_script_structure():
                         # Try to clean and parse
                         try:
                             # Remove any trailing commas and clean up
-                            cleaned = re.sub(r',\s*}', '}', first_job_text)
-                            cleaned = re.sub(r'[^\x20-\x7E]', '', cleaned)
+                            cleaned = _TRAILING_COMMA_RE.sub('}', first_job_text)
+                            cleaned = cleaned.encode('utf-8').translate(None, _NON_PRINTABLE_BYTES)
                             
-                            job_data = json.loads(cleaned)
+                            job_data = orjson.loads(cleaned)
                             print(f"✅ Successfully parsed first job object!")
                             print(f"Keys: {list(job_data.keys())}")
                             
@@ -6,9 +6,91 @@ Find Character AI's actual career page.
 import asyncio
 import aiohttp
 import re
+from typing import Any, Dict, Optional, Tuple
+
+from scrapers.http_cache import ResponseCache
+
+CAREER_KEYWORDS = ['career', 'job', 'position', 'opening', 'hire', 'recruit', 'join', 'team']
+_CAREER_PROBES = [(keyword, keyword.encode()) for keyword in CAREER_KEYWORDS]
+
+def analyze_page(body: bytes) -> Dict[str, Any]:
+    """
+    Look for career keywords and job platform indicators in a page.
+    
+    Works on the raw body: every keyword is ASCII, so an ASCII-only bytes.lower()
+    is enough and the page never has to be decoded to str.
+    """
+    lowered = body.lower()
+    
+    platform = None
+    if b'ashby' in lowered:
+        platform = 'Ashby'
+    elif b'greenhouse' in lowered:
+        platform = 'Greenhouse'
+    elif b'lever' in lowered:
+        platform = 'Lever'
+    
+    return {
+        'keywords': [keyword for keyword, probe in _CAREER_PROBES if probe in lowered],
+        # Look for job listings or career links
+        'is_career_page': b'job' in lowered or b'career' in lowered,
+        'platform': platform,
+    }
+
+async def probe_url(session: aiohttp.ClientSession, url: str, headers: Dict[str, str]) -> bool:
+    """Check with a cheap HEAD request whether a URL serves an HTML page."""
+    try:
+        async with session.head(url, headers=headers, allow_redirects=True, timeout=5) as response:
+            print(f"   {url} -> {response.status}")
+            if response.status == 405:
+                # HEAD not supported here, let the GET decide
+                return True
+            return response.status == 200 and 'text/html' in response.headers.get('Content-Type', '')
+    except Exception as e:
+        print(f"   {url} -> Error: {e}")
+        return False
+
+async def fetch_analysis(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Dict[str, str],
+    cache: ResponseCache,
+) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+    """
+    Fetch a page with a conditional GET and return its analysis and body.
+    
+    A 304 reuses the cached analysis (the body is then None). If that cached
+    analysis is unusable the entry has been evicted, so the page is fetched
+    again without validators.
+    """
+    validators = cache.conditional_headers(url)
+    async with session.get(url, headers={**headers, **validators}, timeout=10) as response:
+        print(f"   Status: {response.status}")
+        
+        if response.status == 304 and validators:
+            page = cache.get_payload(url, dict)
+            if page is not None:
+                print(f"   ♻️  Not modified since last run - reusing cached analysis")
+                return page, None
+        elif response.status == 200:
+            body = await response.read()
+            page = analyze_page(body)
+            cache.store(url, response.headers, page)
+            return page, body
+        else:
+            return None, None
+    
+    return await fetch_analysis(session, url, headers, cache)
 
 async def find_character_ai_careers():
-    """Find Character AI's career page."""
+    """
+    Find Character AI's career page.
+    
+    All candidate URLs are probed concurrently with HEAD requests, then only
+    the ones serving HTML are fetched, in order, with conditional GETs. When a
+    page is unchanged since the last run its cached analysis is reused and the
+    returned body is None.
+    """
     print("🔍 Finding Character AI Careers")
     print("=" * 40)
     
@@ -29,56 +111,50 @@ async def find_character_ai_careers():
         'Accept-Language': 'en-US,en;q=0.5',
     }
     
+    cache = ResponseCache(".cache/character_ai_scan.json")
+    
     async with aiohttp.ClientSession() as session:
-        for url in possible_urls:
+        print("🔍 Probing candidate URLs...")
+        serves_html = await asyncio.gather(*[probe_url(session, url, headers) for url in possible_urls])
+        
+        for url, is_html in zip(possible_urls, serves_html):
+            if not is_html:
+                continue
+            
             print(f"🔍 Trying: {url}")
             
             try:
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    print(f"   Status: {response.status}")
-                    
-                    if response.status == 200:
-                        html = await response.text()
+                page, body = await fetch_analysis(session, url, headers, cache)
+                
+                if page is not None:
+                    if page['keywords']:
+                        print(f"   ✅ Career keywords found: {', '.join(page['keywords'])}")
                         
-                        # Look for career-related content
-                        career_keywords = ['career', 'job', 'position', 'opening', 'hire', 'recruit', 'join', 'team']
-                        found_keywords = []
-                        
-                        for keyword in career_keywords:
-                            if keyword.lower() in html.lower():
-                                found_keywords.append(keyword)
-                        
-                        if found_keywords:
-                            print(f"   ✅ Career keywords found: {', '.join(found_keywords)}")
+                        if page['is_career_page']:
+                            print(f"   📋 This looks like a career page!")
+                            
+                            # Check for platform indicators
+                            if page['platform']:
+                                print(f"   🎯 Uses {page['platform']} platform")
+                            else:
+                                print(f"   ❓ Platform not detected")
                             
-                            # Look for job listings or career links
-                            if 'job' in html.lower() or 'career' in html.lower():
-                                print(f"   📋 This looks like a career page!")
-                                
-                                # Check for platform indicators
-                                if 'ashby' in html.lower():
-                                    print(f"   🎯 Uses Ashby platform")
-                                elif 'greenhouse' in html.lower():
-                                    print(f"   🎯 Uses Greenhouse platform")
-                                elif 'lever' in html.lower():
-                                    print(f"   🎯 Uses Lever platform")
-                                else:
-                                    print(f"   ❓ Platform not detected")
-                                
-                                return url, html
-                        else:
-                            print(f"   ❌ No career content found")
+                            cache.save()
+                            return url, body
                     else:
-                        print(f"   ❌ Page not accessible")
-                        
+                        print(f"   ❌ No career content found")
+                else:
+                    print(f"   ❌ Page not accessible")
+                    
             except Exception as e:
                 print(f"   ❌ Error: {e}")
     
+    cache.save()
     return None, None
 
 async def main():
     """Main function."""
-    career_url, html = await find_character_ai_careers()
+    career_url, body = await find_character_ai_careers()
     
     if career_url:
         print(f"\n🎯 FOUND CAREER PAGE: {career_url}")
@@ -6,10 +6,125 @@ Check the actual career pages of companies to see what platforms they use.
 import asyncio
 import aiohttp
 import re
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-async def check_company_careers(company_name: str, career_url: str) -> Dict:
-    """Check what platform a company is actually using for careers."""
+from scrapers.http_cache import ResponseCache
+
+# Keywords that identify the job platform behind a career page
+PLATFORM_HINTS = {
+    'greenhouse': ['greenhouse', 'boards.greenhouse.io'],
+    'lever': ['lever', 'jobs.lever.co', 'lever.co'],
+    'ashby': ['ashby', 'jobs.ashbyhq.com', 'ashbyhq.com'],
+    'workday': ['workday', 'wd1.myworkdayjobs.com'],
+    'bamboo': ['bamboo', 'bamboohr.com'],
+    'smartrecruiters': ['smartrecruiters', 'smartrecruiters.com'],
+    'icims': ['icims', 'icims.com'],
+    'custom': ['custom', 'built-in', 'internal']
+}
+
+# Keywords that contain a shorter keyword of the same platform can never add a
+# hit, so only the minimal ones are scanned for
+_PLATFORM_PROBES = {
+    platform: [
+        keyword.lower().encode() for keyword in keywords
+        if not any(other != keyword and other.lower() in keyword.lower() for other in keywords)
+    ]
+    for platform, keywords in PLATFORM_HINTS.items()
+}
+
+_ASHBY_URL_RE = re.compile(rb'https://jobs\.ashbyhq\.com/[^"\s]+')
+
+# Pages are scanned in chunks; the tail of each chunk is carried into the next
+# one so keywords and URLs split across a chunk boundary are still found
+CHUNK_SIZE = 65536
+_CHUNK_OVERLAP = 512
+
+
+async def scan_career_page(response: aiohttp.ClientResponse) -> Dict[str, Any]:
+    """Scan a career page body chunk by chunk without buffering the whole page."""
+    platforms = set()
+    has_career_content = False
+    ashby_url = None
+    size = 0
+    tail = b''
+
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        size += len(chunk)
+        window = tail + chunk
+        lowered = window.lower()
+
+        for platform, keywords in _PLATFORM_PROBES.items():
+            if platform not in platforms and any(keyword in lowered for keyword in keywords):
+                platforms.add(platform)
+
+        if not has_career_content:
+            has_career_content = b'jobs' in lowered or b'careers' in lowered
+
+        if ashby_url is None:
+            match = _ASHBY_URL_RE.search(window)
+            # A match running up to the end of the window may continue in the next chunk
+            if match and match.end() < len(window):
+                ashby_url = match.group(0).decode()
+
+        tail = window[-_CHUNK_OVERLAP:]
+
+    if ashby_url is None:
+        match = _ASHBY_URL_RE.search(tail)
+        if match:
+            ashby_url = match.group(0).decode()
+
+    return {
+        # Keep the order of PLATFORM_HINTS in the report
+        'platforms': [platform for platform in PLATFORM_HINTS if platform in platforms],
+        'has_career_content': has_career_content,
+        'ashby_url': ashby_url if 'ashby' in platforms else None,
+        'size': size,
+    }
+
+
+async def fetch_scan(
+    session: aiohttp.ClientSession,
+    career_url: str,
+    headers: Dict[str, str],
+    cache: Optional[ResponseCache] = None
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Fetch a career page and return the response status and its scan.
+
+    An unusable cached scan behind a 304 has been evicted by the cache, so the
+    page is fetched again without validators.
+    """
+    validators = cache.conditional_headers(career_url) if cache else {}
+    async with session.get(career_url, headers={**headers, **validators}, timeout=15) as response:
+        print(f"   Status: {response.status}")
+
+        if response.status == 304 and validators:
+            page = cache.get_payload(career_url, dict)
+            if page is not None:
+                print(f"   ♻️  Not modified since last check - reusing cached scan")
+                return response.status, page
+        elif response.status == 200:
+            page = await scan_career_page(response)
+            if cache:
+                cache.store(career_url, response.headers, page)
+            return response.status, page
+        else:
+            return response.status, None
+
+    return await fetch_scan(session, career_url, headers, cache)
+
+
+async def check_company_careers(
+    company_name: str,
+    career_url: str,
+    cache: Optional[ResponseCache] = None
+) -> Dict:
+    """
+    Check what platform a company is actually using for careers.
+
+    When a cache is given the page is fetched with a conditional GET, and an
+    unchanged page (304) reuses the scan stored from the previous run.
+    """
     print(f"🔍 Checking {company_name}: {career_url}")
     
     # Set up headers to avoid encoding issues
@@ -22,69 +137,47 @@ async def check_company_careers(company_name: str, career_url: str) -> Dict:
     
     async with aiohttp.ClientSession() as session:
         try:
-            async with session.get(career_url, headers=headers, timeout=15) as response:
-                print(f"   Status: {response.status}")
+            status, page = await fetch_scan(session, career_url, headers, cache)
+
+            if page is not None:
+                detected_platforms = page['platforms']
+                has_career_content = page['has_career_content']
                 
-                if response.status == 200:
-                    html = await response.text()
-                    
-                    # Look for platform indicators
-                    platform_hints = {
-                        'greenhouse': ['greenhouse', 'boards.greenhouse.io'],
-                        'lever': ['lever', 'jobs.lever.co', 'lever.co'],
-                        'ashby': ['ashby', 'jobs.ashbyhq.com', 'ashbyhq.com'],
-                        'workday': ['workday', 'wd1.myworkdayjobs.com'],
-                        'bamboo': ['bamboo', 'bamboohr.com'],
-                        'smartrecruiters': ['smartrecruiters', 'smartrecruiters.com'],
-                        'icims': ['icims', 'icims.com'],
-                        'custom': ['custom', 'built-in', 'internal']
-                    }
-                    
-                    detected_platforms = []
-                    for platform, keywords in platform_hints.items():
-                        for keyword in keywords:
-                            if keyword.lower() in html.lower():
-                                detected_platforms.append(platform)
-                                break
-                    
-                    if detected_platforms:
-                        print(f"   🎯 Detected platforms: {', '.join(detected_platforms)}")
-                    else:
-                        print(f"   ❓ No clear platform detected")
-                    
-                    # Look for job data patterns
-                    if 'jobs' in html.lower() or 'careers' in html.lower():
-                        print(f"   📋 Career page content detected")
-                    
-                    # Check if it's a custom/redirect page
-                    if len(html) < 1000:
-                        print(f"   ⚠️  Very short page - might be redirect")
-                    
-                    # Look for specific Ashby patterns
-                    if 'ashby' in html.lower():
-                        ashby_pattern = r'https://jobs\.ashbyhq\.com/[^"\s]+'
-                        ashby_urls = re.findall(ashby_pattern, html)
-                        if ashby_urls:
-                            print(f"   🔗 Ashby URL: {ashby_urls[0]}")
-                    
-                    return {
-                        'company': company_name,
-                        'url': career_url,
-                        'status': response.status,
-                        'platforms': detected_platforms,
-                        'has_career_content': 'jobs' in html.lower() or 'careers' in html.lower()
-                    }
-                    
+                if detected_platforms:
+                    print(f"   🎯 Detected platforms: {', '.join(detected_platforms)}")
                 else:
-                    print(f"   ❌ Failed to load page")
-                    return {
-                        'company': company_name,
-                        'url': career_url,
-                        'status': response.status,
-                        'platforms': [],
-                        'has_career_content': False
-                    }
-                    
+                    print(f"   ❓ No clear platform detected")
+                
+                # Look for job data patterns
+                if has_career_content:
+                    print(f"   📋 Career page content detected")
+                
+                # Check if it's a custom/redirect page
+                if page['size'] < 1000:
+                    print(f"   ⚠️  Very short page - might be redirect")
+                
+                # Look for specific Ashby patterns
+                if page['ashby_url']:
+                    print(f"   🔗 Ashby URL: {page['ashby_url']}")
+                
+                return {
+                    'company': company_name,
+                    'url': career_url,
+                    'status': status,
+                    'platforms': detected_platforms,
+                    'has_career_content': has_career_content
+                }
+                
+            else:
+                print(f"   ❌ Failed to load page")
+                return {
+                    'company': company_name,
+                    'url': career_url,
+                    'status': status,
+                    'platforms': [],
+                    'has_career_content': False
+                }
+                
         except Exception as e:
             print(f"   ❌ Error: {e}")
             return {
@@ -107,16 +200,18 @@ async def main():
     print("🔍 Checking Real Career Pages")
     print("=" * 50)
     
+    cache = ResponseCache(".cache/career_scan.json")
     results = []
     for company_name, career_url in companies:
-        result = await check_company_careers(company_name, career_url)
+        result = await check_company_careers(company_name, career_url, cache)
         results.append(result)
         print()
+    cache.save()
     
     print("📊 SUMMARY:")
     print("=" * 50)
     for result in results:
-        status_icon = "✅" if result['status'] == 200 else "❌"
+        status_icon = "✅" if result['status'] in (200, 304) else "❌"
         platforms = ', '.join(result['platforms']) if result['platforms'] else 'Unknown'
         print(f"{status_icon} {result['company']:15} | {platforms}")
 
@@ -12,9 +12,11 @@ This tool provides an easy way to:
 import asyncio
 import sys
 import os
-from datetime import datetime
+import time
 from typing import Dict, List, Tuple, Optional
 
+import aiohttp
+
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -31,23 +33,43 @@ class CompanyValidator:
     
     def __init__(self):
         self.companies = get_company_configs()
+        self._by_name = {company.name: company for company in self.companies}
         self.scraper_classes = {
             'greenhouse': GreenhouseScraper,
             'lever': LeverScraper,
             'ashby': AshbyScraper,
             'workday': WorkdayScraper,
         }
+        # HTTP session shared by every scraper under test, opened in __aenter__
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self):
+        """Open a pooled HTTP session shared by all scrapers."""
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            limit_per_host=5,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
     
     async def test_company(self, company_name: str, timeout: int = 30) -> Dict:
         """Test a single company's scraper."""
         print(f"🔍 Testing {company_name}...")
         
         # Find company config
-        company_config = None
-        for company in self.companies:
-            if company.name == company_name:
-                company_config = company
-                break
+        company_config = self._by_name.get(company_name)
         
         if not company_config:
             return {
@@ -69,48 +91,26 @@ class CompanyValidator:
                 'duration': 0
             }
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Create scraper instance
-            if scraper_class == GreenhouseScraper:
-                scraper = scraper_class(
-                    company_name=company_config.name,
-                    company_display_name=company_config.display_name,
-                    job_board_url=company_config.job_board_url
-                )
-            elif scraper_class == LeverScraper:
-                scraper = scraper_class(
-                    company_name=company_config.name,
-                    company_display_name=company_config.display_name,
-                    job_board_url=company_config.job_board_url
-                )
-            elif scraper_class == AshbyScraper:
-                scraper = scraper_class(
-                    company_name=company_config.name,
-                    company_display_name=company_config.display_name,
-                    job_board_url=company_config.job_board_url
-                )
-            elif scraper_class == WorkdayScraper:
-                scraper = scraper_class(
-                    company_name=company_config.name,
-                    company_display_name=company_config.display_name,
-                    job_board_url=company_config.job_board_url
-                )
-            else:
-                return {
-                    'name': company_name,
-                    'status': 'error',
-                    'error': f'Unsupported scraper class: {scraper_class.__name__}',
-                    'jobs_count': 0,
-                    'duration': 0
-                }
+            scraper_kwargs = {
+                'company_name': company_config.name,
+                'company_display_name': company_config.display_name,
+                'job_board_url': company_config.job_board_url,
+                'session': self._session
+            }
+            if scraper_class is WorkdayScraper:
+                scraper_kwargs['base_url'] = company_config.base_url
+                scraper_kwargs['company_id'] = company_config.additional_config.get("company_id", company_config.name)
+            scraper = scraper_class(**scraper_kwargs)
             
             # Test scraper with timeout
             async with scraper:
                 jobs = await asyncio.wait_for(scraper.scrape_jobs(), timeout=timeout)
                 
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 return {
                     'name': company_name,
@@ -122,7 +122,7 @@ class CompanyValidator:
                 }
                 
         except asyncio.TimeoutError:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             return {
                 'name': company_name,
                 'status': 'timeout',
@@ -131,7 +131,7 @@ class CompanyValidator:
                 'duration': duration
             }
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             return {
                 'name': company_name,
                 'status': 'error',
@@ -140,15 +140,27 @@ class CompanyValidator:
                 'duration': duration
             }
     
-    async def test_all_companies(self, timeout: int = 30) -> List[Dict]:
-        """Test all companies and return results."""
+    async def test_all_companies(self, timeout: int = 30, max_concurrency: int = 10) -> List[Dict]:
+        """
+        Test all companies concurrently and return results.
+
+        At most max_concurrency scrapers run at once; results are reported
+        (and returned) in the order the tests finish.
+        """
         print("🚀 Testing all company scrapers...")
         print("=" * 60)
         
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def test_one(company_name: str) -> Dict:
+            async with semaphore:
+                return await self.test_company(company_name, timeout)
+        
         results = []
+        tasks = [test_one(company.name) for company in self.companies]
         
-        for company in self.companies:
-            result = await self.test_company(company.name, timeout)
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
             results.append(result)
             
             # Show immediate feedback
@@ -169,9 +181,17 @@ class CompanyValidator:
         
         # Summary stats
         total_companies = len(results)
-        working = len([r for r in results if r['status'] == 'success'])
-        failing = len([r for r in results if r['status'] != 'success'])
-        total_jobs = sum([r['jobs_count'] for r in results if r['status'] == 'success'])
+        working_results = []
+        failing_results = []
+        total_jobs = 0
+        for r in results:
+            if r['status'] == 'success':
+                working_results.append(r)
+                total_jobs += r['jobs_count']
+            else:
+                failing_results.append(r)
+        working = len(working_results)
+        failing = len(failing_results)
         
         print(f"📊 SUMMARY:")
         print(f"   Total Companies: {total_companies}")
@@ -183,7 +203,6 @@ class CompanyValidator:
         # Working companies
         if working > 0:
             print("✅ WORKING COMPANIES:")
-            working_results = [r for r in results if r['status'] == 'success']
             working_results.sort(key=lambda x: x['jobs_count'], reverse=True)
             
             for result in working_results:
@@ -193,8 +212,6 @@ class CompanyValidator:
         # Failing companies
         if failing > 0:
             print("❌ FAILING COMPANIES:")
-            failing_results = [r for r in results if r['status'] != 'success']
-            
             for result in failing_results:
                 status_icon = "⏰" if result['status'] == 'timeout' else "❌"
                 print(f"   {status_icon} {result['name']:20} | {result['error']}")
@@ -236,37 +253,37 @@ class CompanyValidator:
 
 async def main():
     """Main function with command line interface."""
-    validator = CompanyValidator()
+    async with CompanyValidator() as validator:
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
+        if len(sys.argv) > 1:
+            command = sys.argv[1].lower()
         
-        if command == "test" and len(sys.argv) > 2:
-            # Test specific company: python company_validator.py test openai
-            company_name = sys.argv[2]
-            await validator.quick_test(company_name)
+            if command == "test" and len(sys.argv) > 2:
+                # Test specific company: python company_validator.py test openai
+                company_name = sys.argv[2]
+                await validator.quick_test(company_name)
             
-        elif command == "all":
-            # Test all companies: python company_validator.py all
-            results = await validator.test_all_companies()
-            validator.print_health_dashboard(results)
+            elif command == "all":
+                # Test all companies: python company_validator.py all
+                results = await validator.test_all_companies()
+                validator.print_health_dashboard(results)
             
-        elif command == "help":
-            print("Company Validator - Usage:")
-            print("  python company_validator.py test <company_name>  - Test specific company")
-            print("  python company_validator.py all                  - Test all companies")
-            print("  python company_validator.py help                 - Show this help")
-            print()
-            print("Available companies:")
-            for company in validator.companies:
-                print(f"  - {company.name}")
+            elif command == "help":
+                print("Company Validator - Usage:")
+                print("  python company_validator.py test <company_name>  - Test specific company")
+                print("  python company_validator.py all                  - Test all companies")
+                print("  python company_validator.py help                 - Show this help")
+                print()
+                print("Available companies:")
+                for company in validator.companies:
+                    print(f"  - {company.name}")
+            else:
+                print(f"Unknown command: {command}")
+                print("Use 'python company_validator.py help' for usage info")
         else:
-            print(f"Unknown command: {command}")
-            print("Use 'python company_validator.py help' for usage info")
-    else:
-        # Default: test all companies
-        results = await validator.test_all_companies()
-        validator.print_health_dashboard(results)
+            # Default: test all companies
+            results = await validator.test_all_companies()
+            validator.print_health_dashboard(results)
 
 
 if __name__ == "__main__":
@@ -5,15 +5,18 @@ This module defines the companies to track and their career page configurations.
 Each company specifies which platform they use and their specific URLs.
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
+from dataclasses import dataclass, field
 from schemas.job_schema import JobSource
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompanyConfig:
     """
     Configuration for a single company's job postings.
+
+    additional_config is a plain dict, so it is left out of hash().
     """
 
     name: str
@@ -21,11 +24,7 @@ class CompanyConfig:
     source: JobSource
     base_url: str
     job_board_url: str
-    additional_config: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.additional_config is None:
-            self.additional_config = {}
+    additional_config: Dict[str, Any] = field(default_factory=dict, hash=False)
 
 
 # Configuration for major AI labs and companies
@@ -164,14 +163,35 @@ COMPANIES = [
 ]
 
 
-def get_company_configs() -> List[CompanyConfig]:
+# Read-only views of COMPANIES, built once at import
+_ALL_COMPANIES: Tuple[CompanyConfig, ...] = tuple(COMPANIES)
+
+_COMPANIES_BY_NAME: Mapping[str, CompanyConfig] = MappingProxyType(
+    {company.name: company for company in COMPANIES}
+)
+
+
+def _index_by_source() -> Dict[JobSource, Tuple[CompanyConfig, ...]]:
+    """Group COMPANIES by job platform, preserving their order."""
+    by_source: Dict[JobSource, List[CompanyConfig]] = {}
+    for company in COMPANIES:
+        by_source.setdefault(company.source, []).append(company)
+    return {source: tuple(companies) for source, companies in by_source.items()}
+
+
+_COMPANIES_BY_SOURCE: Mapping[JobSource, Tuple[CompanyConfig, ...]] = MappingProxyType(
+    _index_by_source()
+)
+
+
+def get_company_configs() -> Tuple[CompanyConfig, ...]:
     """
     Get all company configurations.
 
     Returns:
-        List of all configured companies
+        Tuple of all configured companies
     """
-    return COMPANIES
+    return _ALL_COMPANIES
 
 
 def get_company_by_name(name: str) -> CompanyConfig:
@@ -187,13 +207,13 @@ def get_company_by_name(name: str) -> CompanyConfig:
     Raises:
         ValueError: If company not found
     """
-    for company in COMPANIES:
-        if company.name == name:
-            return company
-    raise ValueError(f"Company not found: {name}")
+    try:
+        return _COMPANIES_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Company not found: {name}") from None
 
 
-def get_companies_by_source(source: JobSource) -> List[CompanyConfig]:
+def get_companies_by_source(source: JobSource) -> Tuple[CompanyConfig, ...]:
     """
     Get all companies using a specific job platform.
 
@@ -201,6 +221,6 @@ def get_companies_by_source(source: JobSource) -> List[CompanyConfig]:
         source: Job platform to filter by
 
     Returns:
-        List of companies using the specified platform
+        Tuple of companies using the specified platform
     """
-    return [company for company in COMPANIES if company.source == source]
\ No newline at end of file
+    return _COMPANIES_BY_SOURCE.get(source, ())
\ No newline at end of file
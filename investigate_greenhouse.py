@@ -6,7 +6,7 @@ Investigate Greenhouse job boards to discover available companies systematically
 import asyncio
 import aiohttp
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 async def discover_greenhouse_boards():
     """Try to discover Greenhouse job boards systematically."""
@@ -29,29 +29,43 @@ async def discover_greenhouse_boards():
     working_boards = []
     failed_boards = []
     
-    async with aiohttp.ClientSession() as session:
-        for name in common_names:
+    connector = aiohttp.TCPConnector(limit=20, limit_per_host=20, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=10)
+    semaphore = asyncio.Semaphore(20)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def probe(name: str) -> Optional[Dict[str, Any]]:
+            """Probe one board ID, returning its board info or None if it failed."""
             url = f"https://boards-api.greenhouse.io/v1/boards/{name}"
-            print(f"🔍 Testing: {name}")
             
-            try:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        company_name = data.get('name', 'Unknown')
-                        print(f"✅ {name} -> {company_name}")
-                        working_boards.append({
-                            'board_id': name,
-                            'company_name': company_name,
-                            'url': url
-                        })
-                    else:
-                        print(f"❌ {name} -> {response.status}")
-                        failed_boards.append(name)
-                        
-            except Exception as e:
-                print(f"❌ {name} -> Error: {e}")
-                failed_boards.append(name)
+            async with semaphore:
+                try:
+                    async with session.get(url) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            company_name = data.get('name', 'Unknown')
+                            print(f"✅ {name} -> {company_name}")
+                            return {
+                                'board_id': name,
+                                'company_name': company_name,
+                                'url': url
+                            }
+                        else:
+                            print(f"❌ {name} -> {response.status}")
+                            return None
+                            
+                except Exception as e:
+                    print(f"❌ {name} -> Error: {e}")
+                    return None
+        
+        print(f"🔍 Testing {len(common_names)} board IDs...")
+        results = await asyncio.gather(*(probe(name) for name in common_names))
+    
+    for name, board in zip(common_names, results):
+        if board:
+            working_boards.append(board)
+        else:
+            failed_boards.append(name)
     
     print(f"\n📊 RESULTS:")
     print(f"✅ Working boards: {len(working_boards)}")
@@ -9,8 +9,11 @@ It orchestrates the scraping, change detection, and output generation process.
 import asyncio
 import logging
 import argparse
-from datetime import datetime, date
-from typing import List
+import time
+from datetime import date
+from typing import List, Optional
+
+import aiohttp
 
 from config.companies import get_company_configs
 from scrapers.base_scraper import ScraperRegistry
@@ -18,6 +21,7 @@ from scrapers.greenhouse_scraper import GreenhouseScraper
 from scrapers.lever_scraper import LeverScraper
 from scrapers.workday_scraper import WorkdayScraper
 from scrapers.ashby_scraper import AshbyScraper
+from scrapers.http_cache import ResponseCache
 from schemas.job_schema import JobPosting, JobSource
 from schemas.change_tracker import ChangeTracker, OutputGenerator
 
@@ -32,10 +36,17 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def create_scrapers_for_companies() -> ScraperRegistry:
+def create_scrapers_for_companies(
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[ResponseCache] = None
+) -> ScraperRegistry:
     """
     Create scrapers for all configured companies.
 
+    Args:
+        session: Optional HTTP session shared by every scraper
+        cache: Optional response cache for conditional GETs
+
     Returns:
         ScraperRegistry with all configured scrapers
     """
@@ -48,7 +59,9 @@ def create_scrapers_for_companies() -> ScraperRegistry:
                 scraper = GreenhouseScraper(
                     company_name=company.name,
                     company_display_name=company.display_name,
-                    job_board_url=company.job_board_url
+                    job_board_url=company.job_board_url,
+                    session=session,
+                    cache=cache
                 )
                 registry.register(scraper)
                 logging.info(f"Created Greenhouse scraper for {company.display_name}")
@@ -57,7 +70,9 @@ def create_scrapers_for_companies() -> ScraperRegistry:
                 scraper = LeverScraper(
                     company_name=company.name,
                     company_display_name=company.display_name,
-                    job_board_url=company.job_board_url
+                    job_board_url=company.job_board_url,
+                    session=session,
+                    cache=cache
                 )
                 registry.register(scraper)
                 logging.info(f"Created Lever scraper for {company.display_name}")
@@ -69,6 +84,7 @@ def create_scrapers_for_companies() -> ScraperRegistry:
                     base_url=company.base_url,
                     job_board_url=company.job_board_url,
                     company_id=company.additional_config.get("company_id", company.name),
+                    session=session,
                 )
                 registry.register(scraper)
                 logging.info(f"Created Workday scraper for {company.display_name}")
@@ -78,6 +94,8 @@ def create_scrapers_for_companies() -> ScraperRegistry:
                     company_name=company.name,
                     company_display_name=company.display_name,
                     job_board_url=company.job_board_url,
+                    session=session,
+                    cache=cache,
                 )
                 registry.register(scraper)
                 logging.info(f"Created Ashby scraper for {company.display_name}")
@@ -104,12 +122,11 @@ async def run_scraping(registry: ScraperRegistry) -> List[JobPosting]:
         List of all scraped job postings
     """
     print(f"Starting scraping with {len(registry.scrapers)} scrapers...")
-    start_time = datetime.utcnow()
+    start_time = time.perf_counter()
 
     all_jobs = await registry.run_all()
 
-    end_time = datetime.utcnow()
-    duration = (end_time - start_time).total_seconds()
+    duration = time.perf_counter() - start_time
 
     print(f"Scraping completed in {duration:.1f} seconds")
     print(f"Total jobs collected: {len(all_jobs)}")
@@ -117,20 +134,24 @@ async def run_scraping(registry: ScraperRegistry) -> List[JobPosting]:
     return all_jobs
 
 
-def process_changes(new_jobs: List[JobPosting]) -> ChangeTracker:
+def process_changes(new_jobs: List[JobPosting], run_date: date) -> ChangeTracker:
     """
     Process the scraped jobs and detect changes.
 
+    Events are streamed straight into the run's events CSV as they are found.
+
     Args:
         new_jobs: List of newly scraped job postings
+        run_date: Date for the events file
 
     Returns:
-        ChangeTracker with processed data and events
+        ChangeTracker with processed data and event counts
     """
     print("\nProcessing changes...")
 
     tracker = ChangeTracker()
-    events = tracker.process_new_scraping(new_jobs)
+    with OutputGenerator().events_writer(run_date) as events_sink:
+        tracker.process_new_scraping(new_jobs, events_sink=events_sink)
 
     return tracker
 
@@ -158,33 +179,54 @@ async def main_async(args):
     print("🤖 AI Lab Jobs Tracker")
     print("=" * 50)
 
-    # Step 1: Create scrapers
-    registry = create_scrapers_for_companies()
-    if not registry.scrapers:
-        print("❌ No scrapers were successfully created. Exiting.")
-        return
+    # Validators from the previous run let unchanged boards answer 304
+    cache = ResponseCache(".cache/scrapers.json")
 
-    # Step 2: Run scraping
+    # One pooled HTTP session shared by every scraper
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+        enable_cleanup_closed=True,
+    )
+    # Per-socket limits rather than a total: with limit_per_host, requests to a
+    # shared host (every Greenhouse board) can queue for a connection, and a
+    # total timeout would count that wait against them
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
     try:
-        new_jobs = await run_scraping(registry)
-    except Exception as e:
-        print(f"❌ Scraping failed: {e}")
-        return
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            # Step 1: Create scrapers
+            registry = create_scrapers_for_companies(session, cache)
+            if not registry.scrapers:
+                print("❌ No scrapers were successfully created. Exiting.")
+                return
+
+            # Step 2: Run scraping
+            try:
+                new_jobs = await run_scraping(registry)
+            except Exception as e:
+                print(f"❌ Scraping failed: {e}")
+                return
+    finally:
+        # Keep the validators collected so far even if scraping failed
+        cache.save()
 
     if not new_jobs:
         print("⚠️  No jobs were scraped. Exiting.")
         return
 
+    run_date = args.date or date.today()
+
     # Step 3: Process changes
     try:
-        tracker = process_changes(new_jobs)
+        tracker = process_changes(new_jobs, run_date)
     except Exception as e:
         print(f"❌ Change processing failed: {e}")
         return
 
     # Step 4: Generate outputs
     try:
-        run_date = args.date or date.today()
         generate_outputs(tracker, run_date)
     except Exception as e:
         print(f"❌ Output generation failed: {e}")
@@ -196,20 +238,18 @@ async def main_async(args):
     print(f"   • Scrapers run: {len(registry.scrapers)}")
     print(f"   • Jobs collected: {len(new_jobs)}")
     print(f"   • Active jobs: {len(tracker.get_current_active_jobs())}")
-    print(f"   • Events detected: {len(tracker.events)}")
-
-    if tracker.events:
-        event_counts = {}
-        for event in tracker.events:
-            event_counts[event.event_type] = event_counts.get(event.event_type, 0) + 1
+    event_counts = tracker.event_counts
+    total_events = sum(event_counts.values())
+    print(f"   • Events detected: {total_events}")
 
+    if total_events:
         print(f"   • New jobs: {event_counts.get('appeared', 0)}")
         print(f"   • Updated jobs: {event_counts.get('updated', 0)}")
         print(f"   • Closed jobs: {event_counts.get('closed', 0)}")
 
 
-def main():
-    """Main entry point with argument parsing."""
+def setup_argparse() -> argparse.ArgumentParser:
+    """Build the command line argument parser for the pipeline."""
     parser = argparse.ArgumentParser(
         description="AI Lab Jobs Tracker - Scrape and track job postings from AI companies"
     )
@@ -223,8 +263,12 @@ def main():
         type=lambda x: date.fromisoformat(x),
         help="Run date in YYYY-MM-DD format (defaults to today)"
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    """Main entry point with argument parsing."""
+    args = setup_argparse().parse_args()
 
     # Run the async main function
     asyncio.run(main_async(args))
@@ -9,13 +9,59 @@ event logs for analysis.
 import json
 import csv
 import os
-from typing import Dict, List, Optional, Any, Set
+from contextlib import ExitStack, contextmanager
+from typing import Callable, Dict, List, Optional, Any, Collection, IO, Iterator
 from datetime import datetime, date
-from dataclasses import asdict
+from dataclasses import asdict, fields
+from operator import itemgetter
+
+import orjson
 
 from schemas.job_schema import JobPosting, JobEvent, JobStatus
 
 
+# CSV columns for job postings: every public JobPosting field except the raw
+# source payload (kept only in the registry JSON), sorted
+_JOB_FIELDNAMES = sorted(
+    f.name for f in fields(JobPosting) if f.name != 'raw_data'
+)
+_job_row = itemgetter(*_JOB_FIELDNAMES)
+
+_EVENT_FIELDNAMES = ['event_type', 'job_id', 'timestamp', 'previous_data', 'new_data']
+
+
+def _event_row(event: JobEvent) -> tuple:
+    """Build the events CSV row for a change event."""
+    return (
+        event.event_type,
+        event.job_id,
+        event.timestamp.isoformat(),
+        json.dumps(event.previous_data) if event.previous_data else None,
+        json.dumps(event.new_data) if event.new_data else None
+    )
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = 'w', **kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file next to path and move it over path once written.
+
+    Readers never see a partially written file: the temp file is flushed to
+    disk and swapped in with os.replace, or removed if writing fails.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class ChangeTracker:
     """
     Tracks changes in job postings across multiple runs.
@@ -31,142 +77,140 @@ class ChangeTracker:
         self.current_jobs: Dict[str, JobPosting] = {}
         self.previous_jobs: Dict[str, JobPosting] = {}
         self.events: List[JobEvent] = []
-
-        # Ensure output directories exist
-        os.makedirs(os.path.dirname(registry_file), exist_ok=True)
+        self.event_counts: Dict[str, int] = {}
+        self._events_streamed = False
 
         # Load previous job registry if it exists
         self._load_registry()
 
     def _load_registry(self):
         """Load the previous job registry from disk."""
-        if os.path.exists(self.registry_file):
-            try:
-                with open(self.registry_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for job_dict in data:
-                        job = JobPosting.from_dict(job_dict)
-                        self.previous_jobs[job.job_id] = job
-                print(f"Loaded {len(self.previous_jobs)} previous jobs from registry")
-            except Exception as e:
-                print(f"Warning: Could not load previous registry: {e}")
-                self.previous_jobs = {}
+        try:
+            with open(self.registry_file, 'rb') as f:
+                data = orjson.loads(f.read())
+            self.previous_jobs = {
+                job_dict['job_id']: JobPosting.from_dict(job_dict) for job_dict in data
+            }
+            print(f"Loaded {len(self.previous_jobs)} previous jobs from registry")
+        except FileNotFoundError:
+            self.previous_jobs = {}
+        except Exception as e:
+            print(f"Warning: Could not load previous registry: {e}")
+            self.previous_jobs = {}
 
     def _save_registry(self):
         """Save the current job registry to disk."""
         try:
-            job_dicts = [job.to_dict() for job in self.current_jobs.values()]
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                json.dump(job_dicts, f, indent=2, ensure_ascii=False)
+            # orjson serializes the dataclasses directly, giving the same JSON
+            # as to_dict() without building a dict per job
+            jobs = list(self.current_jobs.values())
+            os.makedirs(os.path.dirname(self.registry_file) or '.', exist_ok=True)
+            with atomic_open(self.registry_file, 'wb') as f:
+                f.write(orjson.dumps(jobs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             print(f"Saved {len(self.current_jobs)} jobs to registry")
         except Exception as e:
             print(f"Error saving registry: {e}")
 
-    def process_new_scraping(self, new_jobs: List[JobPosting]) -> List[JobEvent]:
+    def process_new_scraping(
+        self,
+        new_jobs: List[JobPosting],
+        events_sink: Optional[Callable[[JobEvent], None]] = None
+    ) -> List[JobEvent]:
         """
         Process a new batch of scraped jobs and detect changes.
 
         Args:
             new_jobs: List of newly scraped job postings
+            events_sink: Optional callable that receives each event as it is
+                detected. Events handed to a sink are not kept in self.events.
 
         Returns:
-            List of change events (appeared/updated/closed)
+            List of change events (appeared/updated/closed); empty when
+            events_sink is given
         """
         self.events = []
-        self.current_jobs = {}
+        self._events_streamed = events_sink is not None
+        record_event = events_sink or self.events.append
 
         # Index new jobs by job_id
-        for job in new_jobs:
-            self.current_jobs[job.job_id] = job
-
-        # Detect new and updated jobs
-        current_job_ids: Set[str] = set(self.current_jobs.keys())
-        previous_job_ids: Set[str] = set(self.previous_jobs.keys())
-
-        # Find new jobs
-        new_job_ids = current_job_ids - previous_job_ids
-        for job_id in new_job_ids:
-            job = self.current_jobs[job_id]
-            job.status = JobStatus.NEW
-            job.first_seen = datetime.utcnow()
-            job.last_seen = datetime.utcnow()
-            event = JobEvent(
-                event_type='appeared',
-                job_id=job_id,
-                timestamp=datetime.utcnow(),
-                new_data=job.to_dict()
-            )
-            self.events.append(event)
-
-        # Find updated jobs
-        updated_job_ids = current_job_ids & previous_job_ids
-        for job_id in updated_job_ids:
-            current_job = self.current_jobs[job_id]
-            previous_job = self.previous_jobs[job_id]
+        self.current_jobs = {job.job_id: job for job in new_jobs}
+
+        # A single timestamp for every change detected in this run
+        now = datetime.utcnow()
+        new_count = 0
+        updated_count = 0
+
+        # Detect new and updated jobs in one pass over the current jobs
+        for job_id, current_job in self.current_jobs.items():
+            previous_job = self.previous_jobs.get(job_id)
+
+            if previous_job is None:
+                # New job
+                new_count += 1
+                current_job.status = JobStatus.NEW
+                current_job.first_seen = now
+                current_job.last_seen = now
+                event = JobEvent(
+                    event_type='appeared',
+                    job_id=job_id,
+                    timestamp=now,
+                    new_data=current_job.to_dict()
+                )
+                record_event(event)
 
             # Check if job details have changed
-            if self._jobs_differ(current_job, previous_job):
+            elif self._jobs_differ(current_job, previous_job):
+                updated_count += 1
                 current_job.status = JobStatus.UPDATED
                 current_job.first_seen = previous_job.first_seen  # Preserve original first_seen
-                current_job.last_seen = datetime.utcnow()
-                current_job.updated_at = datetime.utcnow()
+                current_job.last_seen = now
+                current_job.updated_at = now
 
                 event = JobEvent(
                     event_type='updated',
                     job_id=job_id,
-                    timestamp=datetime.utcnow(),
+                    timestamp=now,
                     previous_data=previous_job.to_dict(),
                     new_data=current_job.to_dict()
                 )
-                self.events.append(event)
+                record_event(event)
             else:
                 # Job exists but hasn't changed
                 current_job.status = JobStatus.ACTIVE
                 current_job.first_seen = previous_job.first_seen
-                current_job.last_seen = datetime.utcnow()
+                current_job.last_seen = now
 
         # Find closed/removed jobs
-        closed_job_ids = previous_job_ids - current_job_ids
-        for job_id in closed_job_ids:
-            previous_job = self.previous_jobs[job_id]
-            # Create a copy with closed status
-            closed_job = JobPosting(
-                job_id=previous_job.job_id,
-                source=previous_job.source,
-                company_name=previous_job.company_name,
-                external_id=previous_job.external_id,
-                title=previous_job.title,
-                team=previous_job.team,
-                location=previous_job.location,
-                employment_type=previous_job.employment_type,
-                description=previous_job.description,
-                requirements=previous_job.requirements,
-                job_url=previous_job.job_url,
-                apply_url=previous_job.apply_url,
-                source_url=previous_job.source_url,
-                first_seen=previous_job.first_seen,
-                last_seen=previous_job.last_seen,
-                updated_at=previous_job.updated_at,
-                status=JobStatus.CLOSED,
-                raw_data=previous_job.raw_data
-            )
-            self.current_jobs[job_id] = closed_job
-
+        closed_count = 0
+        for job_id, previous_job in self.previous_jobs.items():
+            if job_id in self.current_jobs:
+                continue
+            closed_count += 1
+            # Snapshot the job before marking it closed in place
             event = JobEvent(
                 event_type='closed',
                 job_id=job_id,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 previous_data=previous_job.to_dict()
             )
-            self.events.append(event)
+            record_event(event)
+
+            previous_job.status = JobStatus.CLOSED
+            self.current_jobs[job_id] = previous_job
+
+        self.event_counts = {
+            'appeared': new_count,
+            'updated': updated_count,
+            'closed': closed_count,
+        }
 
         # Save the updated registry
         self._save_registry()
 
-        print(f"Change detection complete: {len(self.events)} events detected")
-        print(f"  - New jobs: {len(new_job_ids)}")
-        print(f"  - Updated jobs: {len([e for e in self.events if e.event_type == 'updated'])}")
-        print(f"  - Closed jobs: {len(closed_job_ids)}")
+        print(f"Change detection complete: {new_count + updated_count + closed_count} events detected")
+        print(f"  - New jobs: {new_count}")
+        print(f"  - Updated jobs: {updated_count}")
+        print(f"  - Closed jobs: {closed_count}")
 
         return self.events
 
@@ -181,25 +225,29 @@ class ChangeTracker:
         Returns:
             True if jobs differ in meaningful ways
         """
-        # Compare key fields that would indicate a real change
-        fields_to_compare = [
-            'title', 'team', 'location', 'employment_type', 'description'
-        ]
-
-        for field in fields_to_compare:
-            val1 = getattr(job1, field)
-            val2 = getattr(job2, field)
-            if val1 != val2:
-                return True
-
-        return False
+        # Compare key fields that would indicate a real change, most
+        # frequently edited first so the tuple comparison stops early
+        return (
+            (job1.title, job1.description, job1.team, job1.location, job1.employment_type)
+            != (job2.title, job2.description, job2.team, job2.location, job2.employment_type)
+        )
 
     def get_current_active_jobs(self) -> List[JobPosting]:
         """Get all currently active job postings."""
         return [job for job in self.current_jobs.values() if job.is_active]
 
     def get_events_by_type(self, event_type: str) -> List[JobEvent]:
-        """Get all events of a specific type."""
+        """
+        Get all events of a specific type.
+
+        Only available when the last run kept its events; events handed to an
+        events_sink are not retained, so use event_counts for totals instead.
+
+        Raises:
+            RuntimeError: If the last run streamed its events to a sink
+        """
+        if self._events_streamed:
+            raise RuntimeError("Events were streamed to a sink; use event_counts instead")
         return [event for event in self.events if event.event_type == event_type]
 
     def get_job_by_id(self, job_id: str) -> Optional[JobPosting]:
@@ -258,11 +306,27 @@ class OutputGenerator:
 
         filename = os.path.join(snapshot_dir, f"{date_str}.csv")
 
-        all_current_jobs = list(tracker.current_jobs.values())
+        if tracker.current_jobs:
+            self._write_jobs_to_csv(tracker.current_jobs.values(), filename)
+            print(f"Generated snapshot CSV: {filename} ({len(tracker.current_jobs)} jobs)")
+
+    def events_writer(self, run_date: Optional[date] = None) -> 'EventsCsvWriter':
+        """
+        Get a writer that streams events into the daily events CSV.
+
+        Pass it as events_sink to ChangeTracker.process_new_scraping so events
+        are written as they are detected instead of buffered in memory.
 
-        if all_current_jobs:
-            self._write_jobs_to_csv(all_current_jobs, filename)
-            print(f"Generated snapshot CSV: {filename} ({len(all_current_jobs)} jobs)")
+        Args:
+            run_date: Date of the run (defaults to today)
+        """
+        if run_date is None:
+            run_date = date.today()
+
+        events_dir = os.path.join(self.output_base_dir, "events")
+        os.makedirs(events_dir, exist_ok=True)
+
+        return EventsCsvWriter(os.path.join(events_dir, f"{run_date.isoformat()}.csv"))
 
     def _generate_events_csv(self, tracker: ChangeTracker, date_str: str):
         """Generate daily events CSV with all changes from this run."""
@@ -275,43 +339,60 @@ class OutputGenerator:
             self._write_events_to_csv(tracker.events, filename)
             print(f"Generated events CSV: {filename} ({len(tracker.events)} events)")
 
-    def _write_jobs_to_csv(self, jobs: List[JobPosting], filename: str):
+    def _write_jobs_to_csv(self, jobs: Collection[JobPosting], filename: str):
         """Write job postings to CSV file."""
         if not jobs:
             return
 
-        # Get all unique fields from job data
-        fieldnames = set()
-        job_dicts = []
-        for job in jobs:
-            job_dict = job.to_dict()
-            job_dicts.append(job_dict)
-            fieldnames.update(job_dict.keys())
-
-        fieldnames = sorted(list(fieldnames))
-
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(job_dicts)
+        with atomic_open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(_JOB_FIELDNAMES)
+            writer.writerows(_job_row(job.to_dict()) for job in jobs)
 
     def _write_events_to_csv(self, events: List[JobEvent], filename: str):
         """Write events to CSV file."""
         if not events:
             return
 
-        fieldnames = ['event_type', 'job_id', 'timestamp', 'previous_data', 'new_data']
-
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for event in events:
-                row = {
-                    'event_type': event.event_type,
-                    'job_id': event.job_id,
-                    'timestamp': event.timestamp.isoformat(),
-                    'previous_data': json.dumps(event.previous_data) if event.previous_data else None,
-                    'new_data': json.dumps(event.new_data) if event.new_data else None
-                }
-                writer.writerow(row)
\ No newline at end of file
+        with atomic_open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(_EVENT_FIELDNAMES)
+            writer.writerows(_event_row(event) for event in events)
+
+
+class EventsCsvWriter:
+    """
+    Streams change events into an events CSV as they are detected.
+
+    Use as a context manager and call the instance with each event. The file
+    is only created once the first event arrives, and is moved into place
+    atomically when the context exits cleanly.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.count = 0
+        self._stack = ExitStack()
+        self._writer = None
+
+    def __enter__(self) -> 'EventsCsvWriter':
+        return self
+
+    def __call__(self, event: JobEvent):
+        if self._writer is None:
+            csvfile = self._stack.enter_context(
+                atomic_open(self.filename, 'w', newline='', encoding='utf-8')
+            )
+            self._writer = csv.writer(csvfile)
+            self._writer.writerow(_EVENT_FIELDNAMES)
+
+        self._writer.writerow(_event_row(event))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        opened = self._writer is not None
+        self._writer = None
+        # Closes and moves the file into place, or removes it on error
+        self._stack.__exit__(exc_type, exc_val, exc_tb)
+        if opened and exc_type is None:
+            print(f"Generated events CSV: {self.filename} ({self.count} events)")
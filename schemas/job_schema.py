@@ -9,6 +9,19 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
+
+
+# Jobs from one scrape share a timestamp (see BaseScraper.get_current_timestamp),
+# so a registry holds only a handful of distinct values; convert each once
+@lru_cache(maxsize=1024)
+def _format_timestamp(value: datetime) -> str:
+    return value.isoformat()
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value)
 
 
 class JobStatus(Enum):
@@ -28,7 +41,7 @@ class JobSource(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPosting:
     """
     Standardized job posting data structure.
@@ -77,21 +90,31 @@ class JobPosting:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job posting to dictionary for CSV/JSON serialization."""
-        data = asdict(self)
-
-        # Convert enums to strings
-        data['source'] = self.source.value
-        data['status'] = self.status.value
-
-        # Convert datetimes to ISO format strings
-        if self.first_seen:
-            data['first_seen'] = self.first_seen.isoformat()
-        if self.last_seen:
-            data['last_seen'] = self.last_seen.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-
-        return data
+        # Built by hand rather than with asdict(), which deep-copies raw_data
+        # and requirements; enums become values and datetimes ISO strings
+        return {
+            'job_id': self.job_id,
+            'source': self.source.value,
+            'company_name': self.company_name,
+            'external_id': self.external_id,
+            'title': self.title,
+            'job_url': self.job_url,
+            'source_url': self.source_url,
+            'first_seen': _format_timestamp(self.first_seen) if self.first_seen else None,
+            'last_seen': _format_timestamp(self.last_seen) if self.last_seen else None,
+            'team': self.team,
+            'location': self.location,
+            'employment_type': self.employment_type,
+            'description': self.description,
+            'requirements': self.requirements,
+            'apply_url': self.apply_url,
+            'updated_at': _format_timestamp(self.updated_at) if self.updated_at else None,
+            'status': self.status.value,
+            'salary_range': self.salary_range,
+            'remote_policy': self.remote_policy,
+            'experience_level': self.experience_level,
+            'raw_data': self.raw_data,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JobPosting':
@@ -102,11 +125,11 @@ class JobPosting:
 
         # Convert ISO strings back to datetimes
         if data.get('first_seen'):
-            data['first_seen'] = datetime.fromisoformat(data['first_seen'])
+            data['first_seen'] = _parse_timestamp(data['first_seen'])
         if data.get('last_seen'):
-            data['last_seen'] = datetime.fromisoformat(data['last_seen'])
+            data['last_seen'] = _parse_timestamp(data['last_seen'])
         if data.get('updated_at'):
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+            data['updated_at'] = _parse_timestamp(data['updated_at'])
 
         return cls(**data)
 
@@ -121,7 +144,7 @@ class JobPosting:
         return (self.last_seen - self.first_seen).days
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JobEvent:
     """
     Represents a change event for a job posting.
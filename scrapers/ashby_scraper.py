@@ -5,12 +5,41 @@ This scraper fetches job postings from Ashby job boards used by some AI companie
 For companies that don't allow API access (like OpenAI), it falls back to JavaScript extraction.
 """
 
-import re
 import json
+import re
 from typing import List, Dict, Any, Optional
 
+import aiohttp
+import orjson
+
 from schemas.job_schema import JobPosting, JobSource
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, SAVE_RAW_DATA
+from scrapers.http_cache import ResponseCache
+
+
+# Patterns for the JavaScript fallback, applied to the raw page bytes
+_SCRIPT_RE = re.compile(rb'<script[^>]*>([^<]*)</script>', re.DOTALL)
+_JOB_OBJECT_RE = re.compile(rb'\{[^{}]*"id"[^{}]*"title"[^{}]*\}', re.DOTALL)
+_NON_PRINTABLE_BYTES = bytes(range(0x20)) + bytes(range(0x7F, 0x100))
+MAIN_SCRIPT_MIN_LENGTH = 100000
+_JOBS_KEY = b'"jobs"'
+# Job postings carry at least one of these; other id/title objects don't
+_JOB_MARKER_KEYS = (b'"locationName"', b'"teamName"')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _strip_trailing_comma(job_text: bytes) -> bytes:
+    """
+    Drop a trailing comma before the closing brace of a job object.
+
+    Expects text already stripped of _NON_PRINTABLE_BYTES, so only ASCII
+    spaces can sit between the comma and the brace.
+    """
+    # _JOB_OBJECT_RE matches have no inner braces, so the only '}' is the last byte
+    body = job_text[:-1].rstrip(b' ')
+    if body.endswith(b','):
+        return body[:-1] + b'}'
+    return job_text
 
 
 class AshbyScraper(BaseScraper):
@@ -21,6 +50,8 @@ class AshbyScraper(BaseScraper):
         company_name: str,
         company_display_name: str,
         job_board_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         self.company_display_name = company_display_name
         self.company_slug = job_board_url.rstrip("/").split("/")[-1]
@@ -29,11 +60,15 @@ class AshbyScraper(BaseScraper):
             source=JobSource.ASHBY,
             company_name=company_name,
             base_url=job_board_url.rstrip("/"),
-            delay_range=(1, 3),
+            rate_limit=3,
+            session=session,
+            cache=cache,
         )
 
     async def scrape_jobs(self) -> List[JobPosting]:
         """Scrape all job postings from the Ashby board."""
+        self._begin_scrape()
+
         # Try API first
         try:
             data = await self.get_json(self.api_url)
@@ -56,48 +91,66 @@ class AshbyScraper(BaseScraper):
     async def _scrape_from_javascript(self) -> List[JobPosting]:
         """Extract jobs from embedded JavaScript when API is not accessible."""
         try:
-            html = await self.get_page(self.base_url)
+            html = await self.get_bytes(self.base_url)
             if not html:
                 self.logger.error(f"Failed to get HTML from {self.base_url}")
                 return []
             
-            # Find the main script containing job data
-            script_pattern = r'<script[^>]*>([^<]*)</script>'
-            scripts = re.findall(script_pattern, html, re.DOTALL)
-            
-            main_script = None
-            for script in scripts:
-                if len(script) > 100000:  # Look for the large script with job data
-                    main_script = script
-                    break
+            # Find the first large script, which holds the job data
+            main_script = next(
+                (
+                    match.group(1)
+                    for match in _SCRIPT_RE.finditer(html)
+                    if match.end(1) - match.start(1) > MAIN_SCRIPT_MIN_LENGTH
+                ),
+                None
+            )
             
             if not main_script:
                 self.logger.error("No large script found in HTML")
                 return []
             
-            # Extract job objects using the pattern we discovered
-            job_object_pattern = r'\{[^{}]*"id"[^{}]*"title"[^{}]*\}'
-            job_objects = re.findall(job_object_pattern, main_script, re.DOTALL)
-            
-            self.logger.info(f"Found {len(job_objects)} potential job objects in JavaScript")
+            # Decode the embedded jobs array directly when the script has one
+            jobs_data = self._extract_jobs_array(main_script)
+            if jobs_data:
+                jobs = [
+                    job
+                    for job in (
+                        self._parse_job_from_js(item)
+                        for item in jobs_data
+                        if isinstance(item, dict) and 'id' in item and 'title' in item
+                    )
+                    if job
+                ]
+                if jobs:
+                    self.logger.info(f"Successfully extracted {len(jobs)} jobs from the JavaScript jobs array")
+                    return jobs
             
+            # Otherwise extract job objects using the pattern we discovered
             jobs: List[JobPosting] = []
-            for job_text in job_objects:
+            found = 0
+            for match in _JOB_OBJECT_RE.finditer(main_script):
+                found += 1
+                job_text = match.group(0)
+                if not any(key in job_text for key in _JOB_MARKER_KEYS):
+                    continue
+
                 try:
                     # Clean the job text and parse as JSON
-                    cleaned = re.sub(r',\s*}', '}', job_text)
-                    cleaned = re.sub(r'[^\x20-\x7E]', '', cleaned)
+                    cleaned = job_text.translate(None, _NON_PRINTABLE_BYTES)
+                    cleaned = _strip_trailing_comma(cleaned)
                     
-                    job_data = json.loads(cleaned)
+                    job_data = orjson.loads(cleaned)
                     if 'id' in job_data and 'title' in job_data:
                         job = self._parse_job_from_js(job_data)
                         if job:
                             jobs.append(job)
                             
-                except (json.JSONDecodeError, Exception) as e:
+                except (orjson.JSONDecodeError, Exception) as e:
                     self.logger.debug(f"Failed to parse job object: {e}")
                     continue
             
+            self.logger.info(f"Found {found} potential job objects in JavaScript")
             self.logger.info(f"Successfully extracted {len(jobs)} jobs from JavaScript")
             return jobs
             
@@ -105,6 +158,33 @@ class AshbyScraper(BaseScraper):
             self.logger.error(f"JavaScript extraction failed: {e}")
             return []
 
+    def _extract_jobs_array(self, script: bytes) -> Optional[List[Any]]:
+        """
+        Decode the first `"jobs": [...]` array embedded in a script.
+
+        raw_decode parses exactly one JSON value from the opening bracket and
+        reports where it ends, so the rest of the script is never parsed.
+
+        Returns:
+            The decoded list, or None if there is no parsable jobs array
+        """
+        key_pos = script.find(_JOBS_KEY)
+        if key_pos == -1:
+            return None
+
+        value_start = key_pos + len(_JOBS_KEY)
+        bracket_pos = script.find(b'[', value_start)
+        if bracket_pos == -1 or script[value_start:bracket_pos].strip() != b':':
+            return None
+
+        try:
+            jobs_data, _ = _JSON_DECODER.raw_decode(script[bracket_pos:].decode('utf-8', 'replace'))
+        except ValueError as e:
+            self.logger.debug(f"Failed to decode jobs array: {e}")
+            return None
+
+        return jobs_data if isinstance(jobs_data, list) else None
+
     def _parse_job_from_js(self, data: Dict[str, Any]) -> Optional[JobPosting]:
         """Parse a job from JavaScript data into JobPosting schema."""
         external_id = str(data.get("id"))
@@ -132,7 +212,7 @@ class AshbyScraper(BaseScraper):
             source_url=self.base_url,
             first_seen=current_time,
             last_seen=current_time,
-            raw_data=data,
+            raw_data=data if SAVE_RAW_DATA else None,
         )
 
     def _parse_job(self, data: Dict[str, Any]) -> Optional[JobPosting]:
@@ -174,5 +254,5 @@ class AshbyScraper(BaseScraper):
             source_url=self.base_url,
             first_seen=current_time,
             last_seen=current_time,
-            raw_data=data,
+            raw_data=data if SAVE_RAW_DATA else None,
         )
@@ -7,17 +7,36 @@ from different platforms (Greenhouse, Lever, Workday, etc.).
 
 import asyncio
 import logging
+import os
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from urllib.parse import urlsplit
 import time
-import random
 
 import aiohttp
+from asyncio_throttle import Throttler
 from bs4 import BeautifulSoup
-import json
+import orjson
 
 from schemas.job_schema import JobPosting, JobSource
+from scrapers.http_cache import ResponseCache
+
+
+# Keep each posting's raw source payload in JobPosting.raw_data (off by default)
+SAVE_RAW_DATA = os.getenv("AIJOBS_RAW", "0") == "1"
+
+# One throttler per host, shared by every scraper that talks to that host
+_HOST_THROTTLERS: Dict[str, Throttler] = {}
+
+
+def _throttler_for(url: str, rate_limit: int) -> Throttler:
+    """Get the throttler for a URL's host, creating it on first use."""
+    host = urlsplit(url).netloc
+    throttler = _HOST_THROTTLERS.get(host)
+    if throttler is None:
+        throttler = _HOST_THROTTLERS[host] = Throttler(rate_limit=rate_limit, period=1.0)
+    return throttler
 
 
 class BaseScraper(ABC):
@@ -32,35 +51,58 @@ class BaseScraper(ABC):
         source: JobSource,
         company_name: str,
         base_url: str,
-        delay_range: tuple = (1, 3),
+        rate_limit: int = 3,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResponseCache] = None
     ):
         self.source = source
         self.company_name = company_name
         self.base_url = base_url
-        self.delay_range = delay_range
+        self.rate_limit = rate_limit  # Max requests per second to a single host
         self.max_retries = max_retries
         self.timeout = timeout
 
+        # Constant part of every job ID this scraper creates
+        self._job_id_prefix = f"{source.value}_{company_name}_"
+
         # Set up logging
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
         self.logger.setLevel(logging.INFO)
 
-        # Create session as None - will be initialized in context manager
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A session passed in by the caller is shared with other scrapers and is
+        # never closed here; otherwise one is created in the context manager
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = False
+
+        # Optional validator cache: unchanged boards answer 304 and the last
+        # body is reused instead of being downloaded again
+        self.cache = cache
+
+        # Timestamp shared by every job parsed in the current scrape
+        self._scrape_started_at: Optional[datetime] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
-        connector = aiohttp.TCPConnector(limit=10)  # Connection pooling
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        if self.session is None:
+            # Connection pooling; idle connections are kept for follow-up pages
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            )
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._owns_session = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
 
     async def get_page(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
         """
@@ -76,6 +118,26 @@ class BaseScraper(ABC):
         Raises:
             Exception: If all retries fail
         """
+        return await self._fetch(url, headers, as_text=True)
+
+    async def get_bytes(self, url: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        Fetch a URL with retry logic and rate limiting, without decoding the body.
+
+        Args:
+            url: URL to fetch
+            headers: Optional HTTP headers
+
+        Returns:
+            Raw response body
+
+        Raises:
+            Exception: If all retries fail
+        """
+        return await self._fetch(url, headers, as_text=False)
+
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]], as_text: bool):
+        """Request a URL with retries and return its body as text or bytes."""
         if not self.session:
             raise RuntimeError("Scraper must be used as async context manager")
 
@@ -85,17 +147,24 @@ class BaseScraper(ABC):
         if headers:
             default_headers.update(headers)
 
+        validators = self.cache.conditional_headers(url) if self.cache else {}
+
+        throttler = _throttler_for(url, self.rate_limit)
+
         for attempt in range(self.max_retries):
             try:
-                # Rate limiting
-                delay = random.uniform(*self.delay_range)
-                await asyncio.sleep(delay)
+                # Rate limiting: only waits when the host was hit too recently
+                async with throttler:
+                    self.logger.info(f"Fetching {url} (attempt {attempt + 1})")
 
-                self.logger.info(f"Fetching {url} (attempt {attempt + 1})")
+                    body = await self._get_once(url, default_headers, validators, as_text)
+                    if body is None:
+                        # The body cached behind the 304 was unusable and has been
+                        # evicted, so fetch the page again without validators
+                        validators = {}
+                        body = await self._get_once(url, default_headers, validators, as_text)
 
-                async with self.session.get(url, headers=default_headers) as response:
-                    response.raise_for_status()
-                    return await response.text()
+                return body
 
             except Exception as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
@@ -103,6 +172,36 @@ class BaseScraper(ABC):
                     raise
                 await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
+    async def _get_once(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        validators: Dict[str, str],
+        as_text: bool
+    ):
+        """
+        Send a single GET and return its body as text or bytes.
+
+        Returns None when a 304 arrives but the cached body is unusable.
+        """
+        async with self.session.get(url, headers={**headers, **validators}) as response:
+            if response.status == 304 and validators:
+                body = self.cache.get_payload(url, str if as_text else bytes)
+                if body is None:
+                    return None
+                self.logger.info(f"{url} not modified, reusing cached body")
+                return body
+
+            response.raise_for_status()
+            body = await response.read()
+
+            # Only text callers pay for decoding; bytes are cached as they came
+            if as_text:
+                body = body.decode(response.get_encoding(), errors='replace')
+            if self.cache is not None:
+                self.cache.store(url, response.headers, body)
+            return body
+
     async def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
         Fetch JSON data from an API endpoint.
@@ -117,15 +216,69 @@ class BaseScraper(ABC):
         Raises:
             Exception: If request fails or JSON is invalid
         """
-        html = await self.get_page(url, headers)
+        body = await self.get_bytes(url, headers)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON response from {url}: {e}")
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        POST a JSON payload with retry logic and rate limiting.
+
+        Args:
+            url: API endpoint URL
+            payload: JSON-serializable request body
+            headers: Optional HTTP headers
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            Exception: If all retries fail or the response is not valid JSON
+        """
+        if not self.session:
+            raise RuntimeError("Scraper must be used as async context manager")
+
+        default_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Content-Type': 'application/json',
+        }
+        if headers:
+            default_headers.update(headers)
+
+        data = orjson.dumps(payload)
+        throttler = _throttler_for(url, self.rate_limit)
+
+        for attempt in range(self.max_retries):
+            try:
+                async with throttler:
+                    self.logger.info(f"Posting to {url} (attempt {attempt + 1})")
+
+                    async with self.session.post(url, data=data, headers=default_headers) as response:
+                        response.raise_for_status()
+                        body = await response.read()
+                break
+
+            except Exception as e:
+                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                if attempt == self.max_retries - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+
         try:
-            return json.loads(html)
-        except json.JSONDecodeError as e:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from {url}: {e}")
 
     def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup."""
-        return BeautifulSoup(html, 'html.parser')
+        """Parse HTML content using BeautifulSoup with the lxml parser."""
+        return BeautifulSoup(html, 'lxml')
 
     @abstractmethod
     async def scrape_jobs(self) -> List[JobPosting]:
@@ -141,7 +294,7 @@ class BaseScraper(ABC):
 
     def create_job_id(self, external_id: str) -> str:
         """Create a unique job ID combining source and external ID."""
-        return f"{self.source.value}_{self.company_name}_{external_id}"
+        return self._job_id_prefix + external_id
 
     def normalize_text(self, text: Optional[str]) -> Optional[str]:
         """Normalize text by stripping whitespace and handling None values."""
@@ -155,9 +308,13 @@ class BaseScraper(ABC):
             return None
         return self.normalize_text(html_element.get_text())
 
+    def _begin_scrape(self):
+        """Record the start of a scrape; called first thing in scrape_jobs."""
+        self._scrape_started_at = datetime.utcnow()
+
     def get_current_timestamp(self) -> datetime:
-        """Get current UTC timestamp."""
-        return datetime.utcnow()
+        """Get the UTC timestamp of the current scrape, or now outside one."""
+        return self._scrape_started_at or datetime.utcnow()
 
 
 class ScraperRegistry:
@@ -181,17 +338,24 @@ class ScraperRegistry:
         Returns:
             Combined list of all job postings from all scrapers
         """
-        all_jobs = []
-
-        for key, scraper in self.scrapers.items():
+        async def run_one(key: str, scraper: BaseScraper) -> List[JobPosting]:
             try:
                 logging.info(f"Running scraper: {key}")
                 async with scraper as s:
                     jobs = await s.scrape_jobs()
-                    all_jobs.extend(jobs)
                     logging.info(f"Scraper {key} found {len(jobs)} jobs")
+                    return jobs
             except Exception as e:
                 logging.error(f"Scraper {key} failed: {e}")
-                continue
+                return []
+
+        # Scrapers are I/O bound, so run them all concurrently
+        results = await asyncio.gather(
+            *(run_one(key, scraper) for key, scraper in self.scrapers.items())
+        )
+
+        all_jobs = []
+        for jobs in results:
+            all_jobs.extend(jobs)
 
         return all_jobs
\ No newline at end of file
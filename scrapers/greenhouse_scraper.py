@@ -10,8 +10,15 @@ import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import aiohttp
+
 from schemas.job_schema import JobPosting, JobSource, JobStatus
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, SAVE_RAW_DATA
+from scrapers.http_cache import ResponseCache
+
+
+# Board identifier in a Greenhouse board URL
+_BOARD_RE = re.compile(r'boards\.greenhouse\.io/([^/]+)')
 
 
 class GreenhouseScraper(BaseScraper):
@@ -22,10 +29,17 @@ class GreenhouseScraper(BaseScraper):
     This scraper primarily uses the JSON API for reliability and completeness.
     """
 
-    def __init__(self, company_name: str, company_display_name: str, job_board_url: str):
+    def __init__(
+        self,
+        company_name: str,
+        company_display_name: str,
+        job_board_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         # Extract the board identifier from the URL
         # URL format: https://boards.greenhouse.io/{board_id}
-        match = re.search(r'boards\.greenhouse\.io/([^/]+)', job_board_url)
+        match = _BOARD_RE.search(job_board_url)
         if not match:
             raise ValueError(f"Invalid Greenhouse URL format: {job_board_url}")
 
@@ -36,7 +50,9 @@ class GreenhouseScraper(BaseScraper):
             source=JobSource.GREENHOUSE,
             company_name=company_name,
             base_url=job_board_url,
-            delay_range=(2, 5)  # Higher delay for Greenhouse to be respectful
+            rate_limit=2,  # Lower rate for Greenhouse to be respectful
+            session=session,
+            cache=cache
         )
         self.company_display_name = company_display_name
 
@@ -47,6 +63,7 @@ class GreenhouseScraper(BaseScraper):
         Returns:
             List of JobPosting objects with normalized data
         """
+        self._begin_scrape()
         jobs = []
 
         try:
@@ -164,7 +181,7 @@ class GreenhouseScraper(BaseScraper):
                 source_url=self.base_url,
                 first_seen=current_time,
                 last_seen=current_time,
-                raw_data=job_data
+                raw_data=job_data if SAVE_RAW_DATA else None
             )
 
             return job_posting
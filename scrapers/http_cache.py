@@ -0,0 +1,120 @@
+"""
+HTTP response cache for AI Lab Jobs Tracker.
+
+Remembers the ETag/Last-Modified validators a server returned for a URL, along
+with whatever the caller derived from that response. Later requests for the
+same URL can then be sent as conditional GETs, and a 304 Not Modified answer
+is served from the cached payload instead of re-downloading the page.
+Payloads may be anything JSON can hold, or raw bytes, which are stored base64
+encoded.
+"""
+
+import base64
+import binascii
+import logging
+import os
+from typing import Any, Dict, Mapping, Optional, Type
+
+import orjson
+
+from schemas.change_tracker import atomic_open
+
+
+class ResponseCache:
+    """
+    JSON-backed store of HTTP validators and cached payloads keyed by URL.
+
+    Each tool caches a different kind of payload, so each one should use its
+    own cache file rather than sharing entries for the same URL.
+    """
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load cached entries from disk."""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'rb') as f:
+                    self.entries = orjson.loads(f.read())
+            except Exception as e:
+                logging.warning(f"Could not load HTTP cache {self.cache_file}: {e}")
+                self.entries = {}
+
+    def save(self):
+        """Write the cache back to disk if anything changed."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            # An interrupted run must not leave a truncated cache behind
+            with atomic_open(self.cache_file, 'wb') as f:
+                f.write(orjson.dumps(self.entries))
+            self._dirty = False
+        except Exception as e:
+            logging.warning(f"Could not save HTTP cache {self.cache_file}: {e}")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached URL."""
+        entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get_payload(self, url: str, payload_type: Type = object) -> Optional[Any]:
+        """
+        Get the payload stored with the last 200 response for a URL.
+
+        A missing payload, or one that is not a payload_type, is treated as a
+        miss: the entry is evicted so the caller can refetch without validators.
+        """
+        entry = self.entries.get(url)
+        payload = entry.get('payload') if entry else None
+        if entry and entry.get('base64') and isinstance(payload, str):
+            try:
+                payload = base64.b64decode(payload, validate=True)
+            except binascii.Error:
+                payload = None
+        if payload is None or not isinstance(payload, payload_type):
+            self.invalidate(url)
+            return None
+        return payload
+
+    def invalidate(self, url: str):
+        """Forget everything cached for a URL."""
+        if self.entries.pop(url, None) is not None:
+            self._dirty = True
+
+    def store(self, url: str, response_headers: Mapping[str, str], payload: Any):
+        """
+        Remember the validators of a 200 response and the payload derived from it.
+
+        Responses without an ETag or Last-Modified header cannot be revalidated,
+        so any previous entry for the URL is dropped instead.
+        """
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+
+        if not etag and not last_modified:
+            self.invalidate(url)
+            return
+
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'payload': payload,
+        }
+        if isinstance(payload, bytes):
+            entry['payload'] = base64.b64encode(payload).decode('ascii')
+            entry['base64'] = True
+        self.entries[url] = entry
+        self._dirty = True
@@ -6,12 +6,43 @@ used by many AI labs and tech companies like Anthropic and Cohere.
 """
 
 import re
-import json
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import aiohttp
+import orjson
+from lxml import etree
+
 from schemas.job_schema import JobPosting, JobSource, JobStatus
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, SAVE_RAW_DATA
+from scrapers.http_cache import ResponseCache
+
+
+# Site identifier in a Lever board URL
+_LEVER_URL_RE = re.compile(r'jobs\.lever\.co/([^/]+)')
+# Inline scripts that set globals, and the object literals they assign
+_WINDOW_RE = re.compile(r'window\.')
+_WINDOW_ASSIGN_RE = re.compile(r'window\.\w+\s*=\s*({.+?});', re.DOTALL)
+# A JSON blob can only hold job data if it has one of these keys
+_JOB_LIST_KEYS = ('"jobs"', '"postings"', '"data"')
+CHUNK_SIZE = 65536
+
+
+def _iter_scripts(html: str) -> Iterator[Tuple[Optional[str], str]]:
+    """Yield (type, text) for each non-empty script tag, streaming the page through lxml."""
+    parser = etree.HTMLPullParser(events=('end',), tag='script')
+    for start in range(0, len(html), CHUNK_SIZE):
+        parser.feed(html[start:start + CHUNK_SIZE])
+        for _, element in parser.read_events():
+            if element.text:
+                yield element.get('type'), element.text
+            element.clear()
+
+    parser.close()
+    for _, element in parser.read_events():
+        if element.text:
+            yield element.get('type'), element.text
+        element.clear()
 
 
 class LeverScraper(BaseScraper):
@@ -22,10 +53,17 @@ class LeverScraper(BaseScraper):
     This scraper extracts job data from both sources.
     """
 
-    def __init__(self, company_name: str, company_display_name: str, job_board_url: str):
+    def __init__(
+        self,
+        company_name: str,
+        company_display_name: str,
+        job_board_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         # Extract the site identifier from the URL
         # URL format: https://jobs.lever.co/{site_id}
-        match = re.search(r'jobs\.lever\.co/([^/]+)', job_board_url)
+        match = _LEVER_URL_RE.search(job_board_url)
         if not match:
             raise ValueError(f"Invalid Lever URL format: {job_board_url}")
 
@@ -35,7 +73,9 @@ class LeverScraper(BaseScraper):
             source=JobSource.LEVER,
             company_name=company_name,
             base_url=job_board_url,
-            delay_range=(1.5, 4)  # Respectful delay for Lever
+            rate_limit=2,  # Respectful rate for Lever
+            session=session,
+            cache=cache
         )
         self.company_display_name = company_display_name
 
@@ -46,6 +86,7 @@ class LeverScraper(BaseScraper):
         Returns:
             List of JobPosting objects with normalized data
         """
+        self._begin_scrape()
         jobs = []
 
         try:
@@ -83,17 +124,25 @@ class LeverScraper(BaseScraper):
             List of job data dictionaries
         """
         jobs = []
+        window_script = None
 
         try:
-            # Look for the embedded JSON data in script tags
-            soup = self.parse_html(html)
-
-            # Find script tags that contain job data
-            script_tags = soup.find_all('script', type='application/json')
+            # Script tags are the only part of the page we need, so stream them
+            # out of lxml instead of building a document tree
+            for script_type, text in _iter_scripts(html):
+                # Remember the first script setting globals for the fallback below
+                if window_script is None and _WINDOW_RE.search(text):
+                    window_script = text
+
+                # Look for the embedded JSON data, skipping unrelated blobs
+                # (config, i18n strings) without parsing them
+                if script_type != 'application/json':
+                    continue
+                if not any(key in text for key in _JOB_LIST_KEYS):
+                    continue
 
-            for script in script_tags:
                 try:
-                    data = json.loads(script.string)
+                    data = orjson.loads(text)
                     # Look for job data in various possible structures
                     if isinstance(data, dict):
                         # Check common locations where job data might be stored
@@ -105,22 +154,25 @@ class LeverScraper(BaseScraper):
                             jobs.extend(data['data'])
                         elif isinstance(data.get('props'), dict) and 'jobs' in data['props']:
                             jobs.extend(data['props']['jobs'])
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
 
+                # The whole jobs list lives in one blob; stop reading the page
+                if jobs:
+                    break
+
             # Alternative: look for window.STATE or similar global variables
             if not jobs:
-                script_content = soup.find('script', string=re.compile(r'window\.'))
-                if script_content:
+                if window_script:
                     # Extract JSON from JavaScript variable assignments
-                    matches = re.findall(r'window\.\w+\s*=\s*({.+?});', script_content.string, re.DOTALL)
+                    matches = _WINDOW_ASSIGN_RE.findall(window_script)
                     for match in matches:
                         try:
-                            data = json.loads(match)
+                            data = orjson.loads(match)
                             if 'jobs' in data:
                                 jobs.extend(data['jobs'])
                                 break
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             continue
 
         except Exception as e:
@@ -212,7 +264,7 @@ class LeverScraper(BaseScraper):
                 source_url=self.base_url,
                 first_seen=current_time,
                 last_seen=current_time,
-                raw_data=job_data
+                raw_data=job_data if SAVE_RAW_DATA else None
             )
 
             return job_posting
@@ -5,10 +5,17 @@ This scraper fetches job postings from Workday-powered career sites
 used by many AI companies.
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional
 
+import aiohttp
+
 from schemas.job_schema import JobPosting, JobSource
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, SAVE_RAW_DATA
+
+
+# Most batch requests in flight at once after the first page
+MAX_CONCURRENT_BATCHES = 8
 
 
 class WorkdayScraper(BaseScraper):
@@ -21,46 +28,61 @@ class WorkdayScraper(BaseScraper):
         base_url: str,
         job_board_url: str,
         company_id: str,
+        session: Optional[aiohttp.ClientSession] = None,
     ):
         self.company_display_name = company_display_name
         self.company_id = company_id
         self.job_board_url = job_board_url.rstrip("/")
+        self._job_url_prefix = f"{self.job_board_url}/job/"
         self.api_base_url = f"{base_url.rstrip('/')}/wday/cxs/{company_id}/{self.job_board_url.split('/')[-1]}"
         super().__init__(
             source=JobSource.WORKDAY,
             company_name=company_name,
             base_url=self.job_board_url,
-            delay_range=(1, 3),
+            rate_limit=3,
+            session=session,
         )
 
     async def scrape_jobs(self) -> List[JobPosting]:
         """Scrape all job postings from the Workday board."""
+        self._begin_scrape()
         jobs: List[JobPosting] = []
-        offset = 0
         limit = 50
-        while True:
-            data = await self._fetch_jobs_batch(offset, limit)
-            postings = data.get("jobPostings", [])
-            for posting in postings:
+
+        # The first page reports the total, so the remaining offsets are known
+        # up front and can be fetched concurrently
+        first = await self._fetch_jobs_batch(0, limit)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_jobs_batch(offset, limit)
+
+        tasks = [
+            asyncio.ensure_future(fetch(offset))
+            for offset in range(limit, first.get("total", 0), limit)
+        ]
+        try:
+            rest = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave sibling batches running against a session about to close
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        for data in (first, *rest):
+            for posting in data.get("jobPostings", []):
                 job = self._parse_job(posting)
                 if job:
                     jobs.append(job)
-            total = data.get("total", 0)
-            offset += limit
-            if offset >= total:
-                break
         self.logger.info(f"Successfully scraped {len(jobs)} jobs from Workday")
         return jobs
 
     async def _fetch_jobs_batch(self, offset: int, limit: int) -> Dict[str, Any]:
         """Fetch a batch of jobs from Workday API."""
-        if not self.session:
-            raise RuntimeError("Scraper must be used as async context manager")
-        url = f"{self.api_base_url}/jobs"
         payload = {"limit": limit, "offset": offset, "searchText": ""}
-        async with self.session.post(url, json=payload) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+        return await self.post_json(f"{self.api_base_url}/jobs", payload)
 
     def _parse_job(self, data: Dict[str, Any]) -> Optional[JobPosting]:
         """Parse a Workday job posting into JobPosting schema."""
@@ -75,7 +97,7 @@ class WorkdayScraper(BaseScraper):
                 location = self.normalize_text(field.get("text"))
                 break
 
-        job_url = f"{self.job_board_url}/job/{external_id}"
+        job_url = self._job_url_prefix + external_id
         current_time = self.get_current_timestamp()
         return JobPosting(
             job_id=self.create_job_id(external_id),
@@ -88,5 +110,5 @@ class WorkdayScraper(BaseScraper):
             source_url=self.base_url,
             first_seen=current_time,
             last_seen=current_time,
-            raw_data=data,
+            raw_data=data if SAVE_RAW_DATA else None,
         )
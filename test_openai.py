@@ -4,10 +4,17 @@ Test different approaches to access OpenAI careers page.
 """
 
 import asyncio
+import re
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 
+# Words marking job-related class names and scripts, matched case-insensitively
+_JOB_CLASS_RE = re.compile(r'job|career|position|role', re.IGNORECASE)
+_JOB_SCRIPT_RE = re.compile(r'job|position|career', re.IGNORECASE)
+# The only tags the analysis looks at; everything else is left out of the tree
+_ANALYZED_TAGS = SoupStrainer(['div', 'section', 'article', 'script', 'iframe', 'meta', 'title'])
+
 async def test_openai_careers():
     """Test different approaches to access OpenAI careers."""
     url = "https://openai.com/careers/search/"
@@ -60,7 +67,7 @@ async def test_openai_careers():
                     
                     if response.status == 200:
                         html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
+                        soup = BeautifulSoup(html, 'lxml', parse_only=_ANALYZED_TAGS)
                         
                         # Look for job-related content
                         title = soup.find('title')
@@ -68,12 +75,12 @@ async def test_openai_careers():
                             print(f"Page Title: {title.get_text()}")
                         
                         # Check for job listings
-                        job_elements = soup.find_all(['div', 'section', 'article'], class_=lambda x: x and any(word in x.lower() for word in ['job', 'career', 'position', 'role']))
+                        job_elements = soup.find_all(['div', 'section', 'article'], class_=lambda x: x and _JOB_CLASS_RE.search(x))
                         print(f"Job elements found: {len(job_elements)}")
                         
                         # Look for embedded job data
                         scripts = soup.find_all('script')
-                        job_scripts = [s for s in scripts if s.string and any(word in s.string.lower() for word in ['job', 'position', 'career'])]
+                        job_scripts = [s for s in scripts if s.string and _JOB_SCRIPT_RE.search(s.string)]
                         print(f"Job-related scripts: {len(job_scripts)}")
                         
                         # Check for iframes or embedded content
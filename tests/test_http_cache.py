@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.http_cache import ResponseCache
+
+
+URL = "https://character.ai/careers"
+HEADERS = {"ETag": '"abc"', "Last-Modified": "Wed, 14 Oct 2026 00:00:00 GMT"}
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp.name, "cache.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_not_modified_reuses_payload(self):
+        cache = ResponseCache(self.cache_file)
+        cache.store(URL, HEADERS, {"keywords": ["career"]})
+
+        self.assertEqual(cache.conditional_headers(URL)["If-None-Match"], '"abc"')
+        self.assertEqual(cache.get_payload(URL, dict), {"keywords": ["career"]})
+
+    def test_bytes_payload_round_trips_through_disk(self):
+        cache = ResponseCache(self.cache_file)
+        cache.store(URL, HEADERS, b"\xffnot utf-8")
+        cache.save()
+
+        cache = ResponseCache(self.cache_file)
+        self.assertEqual(cache.get_payload(URL, bytes), b"\xffnot utf-8")
+        self.assertFalse(os.path.exists(self.cache_file + ".tmp"))
+
+    def test_not_modified_with_wrong_payload_type_is_a_miss(self):
+        # Another tool stored a str body for the same URL
+        cache = ResponseCache(self.cache_file)
+        cache.store(URL, HEADERS, "<html></html>")
+        cache.save()
+
+        cache = ResponseCache(self.cache_file)
+        self.assertIsNone(cache.get_payload(URL, dict))
+        # Evicted, so the refetch goes out without validators
+        self.assertEqual(cache.conditional_headers(URL), {})
+
+        cache.save()
+        self.assertNotIn(URL, ResponseCache(self.cache_file).entries)
+
+    def test_not_modified_with_missing_payload_is_a_miss(self):
+        cache = ResponseCache(self.cache_file)
+        cache.entries[URL] = {"etag": '"abc"', "last_modified": None}
+
+        self.assertIsNone(cache.get_payload(URL))
+        self.assertEqual(cache.conditional_headers(URL), {})
+
+    def test_response_without_validators_drops_entry(self):
+        cache = ResponseCache(self.cache_file)
+        cache.store(URL, HEADERS, {"keywords": []})
+        cache.store(URL, {}, {"keywords": []})
+
+        self.assertEqual(cache.conditional_headers(URL), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
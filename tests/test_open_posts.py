@@ -1,6 +1,5 @@
 import os
 import csv
-import glob
 from datetime import date
 import unittest
 
@@ -15,17 +14,20 @@ def load_snapshot_for_date(target_date: date):
         return candidate
 
     # Fallback: latest snapshot in directory
-    snapshots = sorted(glob.glob(os.path.join(SNAPSHOT_DIR, "*.csv")))
-    return snapshots[-1] if snapshots else None
+    try:
+        with os.scandir(SNAPSHOT_DIR) as entries:
+            snapshots = [entry.path for entry in entries if entry.name.endswith(".csv")]
+    except FileNotFoundError:
+        return None
+    return max(snapshots, default=None)
 
 
 def read_jobs_from_snapshot(snapshot_path: str):
-    jobs = []
+    # Plain rows plus a header index, rather than a dict per row
     with open(snapshot_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            jobs.append(row)
-    return jobs
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return {name: i for i, name in enumerate(header)}, list(reader)
 
 
 class TestOpenCareerPosts(unittest.TestCase):
@@ -33,18 +35,22 @@ class TestOpenCareerPosts(unittest.TestCase):
         snapshot_path = load_snapshot_for_date(date.today())
         self.assertIsNotNone(snapshot_path, "No snapshot CSV found to validate")
 
-        jobs = read_jobs_from_snapshot(snapshot_path)
+        columns, jobs = read_jobs_from_snapshot(snapshot_path)
         self.assertGreater(len(jobs), 0, "Snapshot contains no jobs")
 
+        status, company, title, location, job_url = (
+            columns[name] for name in ("status", "company_name", "title", "location", "job_url")
+        )
+
         # Open posts: anything not closed
-        open_jobs = [j for j in jobs if (j.get("status") or "").lower() != "closed"]
+        open_jobs = [j for j in jobs if j[status].lower() != "closed"]
 
         # Basic sanity: open should be at least one when sample data exists
         self.assertGreater(len(open_jobs), 0, "No open jobs found in today's snapshot")
 
         # Print a compact review line for each open post to test output
         for j in open_jobs:
-            print(f"{j.get('company_name')} | {j.get('title')} | {j.get('location')} | {j.get('job_url')}")
+            print(f"{j[company]} | {j[title]} | {j[location]} | {j[job_url]}")
 
 
 if __name__ == "__main__":